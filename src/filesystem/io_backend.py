@@ -0,0 +1,297 @@
+"""Optional io_uring-backed file I/O for Linux.
+
+When the ``liburing`` bindings are installed and a ring can be set up,
+whole-file reads and writes are submitted through a shared io_uring
+instance, which batches submissions and avoids one context switch per
+syscall on I/O-heavy workloads. Anywhere else (non-Linux, bindings
+missing, ring setup refused by the kernel) the helpers degrade to plain
+blocking calls.
+
+The helpers here are synchronous and block while waiting on completions;
+callers are expected to run them in a worker thread either way.
+"""
+
+import codecs
+import ctypes
+import logging
+import os
+import platform
+import sys
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_QUEUE_DEPTH = 256
+_CHUNK_SIZE = 64 * 1024
+
+# getdents64 reads dirents in bulk; a 256 KiB buffer pulls thousands of
+# entries per syscall versus libc readdir's 32 KiB batches.
+_GETDENTS_BUF_SIZE = 256 * 1024
+_SYS_GETDENTS64 = {"x86_64": 217, "aarch64": 61}.get(platform.machine())
+
+_libc: ctypes.CDLL | None = None
+if sys.platform == "linux" and _SYS_GETDENTS64 is not None:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _libc.syscall.restype = ctypes.c_long
+
+_ring = None
+_ring_lock = threading.Lock()
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+
+def init_ring() -> bool:
+    """Initialize the shared io_uring instance if the platform supports it.
+
+    Returns:
+        True if the uring backend is active, False if falling back to
+        blocking I/O
+
+    """
+    global _ring  # noqa: PLW0603
+
+    if sys.platform != "linux" or liburing is None:
+        return False
+
+    ring = liburing.io_uring()
+    # SQPOLL keeps a kernel thread polling the submission queue, which helps
+    # sustained write throughput but needs elevated privileges on older
+    # kernels; retry without it before giving up entirely.
+    for flags in (liburing.IORING_SETUP_SQPOLL, 0):
+        try:
+            liburing.io_uring_queue_init(_QUEUE_DEPTH, ring, flags)
+        except OSError:
+            continue
+        _ring = ring
+        logger.info("io_uring backend enabled (queue depth %s)", _QUEUE_DEPTH)
+        return True
+
+    logger.info("io_uring unavailable, using blocking file I/O")
+    return False
+
+
+def shutdown_ring() -> None:
+    """Tear down the shared io_uring instance, if one was initialized."""
+    global _ring  # noqa: PLW0603
+
+    if _ring is not None and liburing is not None:
+        liburing.io_uring_queue_exit(_ring)
+        _ring = None
+
+
+def _uring_read(fd: int, size: int) -> bytes:
+    # readv may return fewer bytes than requested; resubmit at the new
+    # offset until the expected size is read or EOF is hit.
+    chunks: list[bytes] = []
+    offset = 0
+    while offset < size:
+        buf = bytearray(size - offset)
+        iov = liburing.iovec(buf)
+        with _ring_lock:
+            sqe = liburing.io_uring_get_sqe(_ring)
+            liburing.io_uring_prep_readv(sqe, fd, iov, len(iov), offset)
+            liburing.io_uring_submit(_ring)
+            cqe = liburing.io_uring_cqe()
+            liburing.io_uring_wait_cqe(_ring, cqe)
+            nread = int(liburing.trap_error(cqe.res))
+            liburing.io_uring_cqe_seen(_ring, cqe)
+        if nread == 0:
+            break
+        chunks.append(bytes(buf[:nread]))
+        offset += nread
+    return b"".join(chunks)
+
+
+def _uring_write(fd: int, data: bytes) -> int:
+    # writev may stop short (e.g. filesystem nearly full); keep submitting
+    # the remainder so a partial write can never be reported as success.
+    view = memoryview(data)
+    offset = 0
+    while offset < len(data):
+        iov = liburing.iovec(bytearray(view[offset:]))
+        with _ring_lock:
+            sqe = liburing.io_uring_get_sqe(_ring)
+            liburing.io_uring_prep_writev(sqe, fd, iov, len(iov), offset)
+            liburing.io_uring_submit(_ring)
+            cqe = liburing.io_uring_cqe()
+            liburing.io_uring_wait_cqe(_ring, cqe)
+            written = int(liburing.trap_error(cqe.res))
+            liburing.io_uring_cqe_seen(_ring, cqe)
+        if written == 0:
+            raise OSError(f"io_uring wrote 0 of {len(data) - offset} remaining bytes")
+        offset += written
+    return offset
+
+
+def list_names(path: Path) -> list[str]:
+    """List directory entry names without per-entry stat data.
+
+    On Linux this calls getdents64 directly with a large buffer, cutting
+    the syscall count roughly 8x on very large directories; elsewhere it
+    falls back to os.scandir. Names are returned unsorted, without the
+    "." and ".." entries.
+
+    Args:
+        path: Absolute path of the directory to list
+
+    Returns:
+        Entry names in the directory
+
+    """
+    sysno = _SYS_GETDENTS64
+    if _libc is None or sysno is None:
+        with os.scandir(path) as it:
+            return [entry.name for entry in it]
+
+    names = []
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    buf = ctypes.create_string_buffer(_GETDENTS_BUF_SIZE)
+    try:
+        while True:
+            nread = _libc.syscall(
+                ctypes.c_long(sysno), ctypes.c_long(fd), buf, ctypes.c_long(_GETDENTS_BUF_SIZE)
+            )
+            if nread < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), str(path))
+            if nread == 0:
+                break
+            raw = buf.raw
+            pos = 0
+            # Each record is a linux_dirent64: u64 d_ino, s64 d_off,
+            # u16 d_reclen, u8 d_type, then the NUL-terminated name at
+            # offset 19.
+            while pos < nread:
+                d_reclen = int.from_bytes(raw[pos + 16 : pos + 18], "little")
+                name_end = raw.index(b"\0", pos + 19)
+                name = raw[pos + 19 : name_end].decode("utf-8", "surrogateescape")
+                if name not in (".", ".."):
+                    names.append(name)
+                pos += d_reclen
+    finally:
+        os.close(fd)
+    return names
+
+
+def count_entries(path: Path) -> int:
+    """Count directory entries without building any per-entry objects.
+
+    On Linux this walks the raw getdents64 records by d_reclen, so a
+    100k-entry directory is counted with a handful of syscalls and zero
+    Python allocations per entry; elsewhere it counts the scandir
+    iterator. "." and ".." are excluded.
+
+    Args:
+        path: Absolute path of the directory to count
+
+    Returns:
+        Number of entries in the directory
+
+    """
+    sysno = _SYS_GETDENTS64
+    if _libc is None or sysno is None:
+        with os.scandir(path) as it:
+            return sum(1 for _ in it)
+
+    count = 0
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    buf = ctypes.create_string_buffer(_GETDENTS_BUF_SIZE)
+    try:
+        while True:
+            nread = _libc.syscall(
+                ctypes.c_long(sysno), ctypes.c_long(fd), buf, ctypes.c_long(_GETDENTS_BUF_SIZE)
+            )
+            if nread < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), str(path))
+            if nread == 0:
+                break
+            raw = buf.raw
+            pos = 0
+            while pos < nread:
+                # Skip "." and ".." by peeking at the name bytes rather
+                # than assuming the kernel always emits them; some FUSE
+                # and network filesystems omit one or both.
+                first = raw[pos + 19]
+                if first != 0x2E or (raw[pos + 20] != 0 and not (raw[pos + 20] == 0x2E and raw[pos + 21] == 0)):
+                    count += 1
+                pos += int.from_bytes(raw[pos + 16 : pos + 18], "little")
+    finally:
+        os.close(fd)
+    return count
+
+
+def read_text(path: Path, max_bytes: int | None = None) -> str:
+    """Read a file as text, through io_uring when the ring is active.
+
+    Args:
+        path: Absolute path of the file to read
+        max_bytes: Byte budget for the read; longer files stop reading at
+            the limit and a multibyte character split by the cut is
+            dropped (default: read the whole file)
+
+    Returns:
+        Decoded file contents
+
+    """
+    if _ring is None:
+        return _blocking_read_text(path, max_bytes)
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = _uring_read(fd, size if max_bytes is None else min(size, max_bytes))
+    finally:
+        os.close(fd)
+    if max_bytes is not None and size > max_bytes:
+        return codecs.getincrementaldecoder("utf-8")().decode(data)
+    return data.decode()
+
+
+def _blocking_read_text(path: Path, max_bytes: int | None) -> str:
+    # Read in bounded chunks rather than one slurp, so a max_bytes budget
+    # stops the read as soon as the limit is reached instead of pulling the
+    # whole file in first. The incremental decoder carries multibyte
+    # characters across chunk boundaries.
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks: list[str] = []
+    remaining = max_bytes
+    with path.open("rb") as f:
+        while True:
+            request = _CHUNK_SIZE if remaining is None else min(_CHUNK_SIZE, remaining)
+            if request == 0:
+                # Budget exhausted; a character split by the cut is dropped.
+                return "".join(chunks)
+            data = f.read(request)
+            if not data:
+                chunks.append(decoder.decode(b"", final=True))
+                return "".join(chunks)
+            chunks.append(decoder.decode(data))
+            if remaining is not None:
+                remaining -= len(data)
+
+
+def write_text(path: Path, content: str) -> int:
+    """Write text to a file, through io_uring when the ring is active.
+
+    Args:
+        path: Absolute path of the file to write
+        content: Content to write
+
+    Returns:
+        Number of bytes written
+
+    """
+    if _ring is None:
+        return path.write_text(content)
+
+    data = content.encode()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        return _uring_write(fd, data)
+    finally:
+        os.close(fd)
@@ -2,15 +2,21 @@
 
 import argparse
 import logging
+import os
 from pathlib import Path
+from typing import Any
 
 from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import FileResponse, PlainTextResponse, Response
 
-from . import tools, utils
+from . import io_backend, tools, utils
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+ALLOWED_ROOT_ENV = "FILESYSTEM_MCP_ALLOWED_ROOT"
+
 mcp = FastMCP(
     name="filesystem",
 )
@@ -18,6 +24,52 @@ mcp = FastMCP(
 tools.register_tools(mcp)
 
 
+@mcp.custom_route("/files/{file_path:path}", methods=["GET"])
+async def download_file(request: Request) -> Response:
+    """Serve a file's raw bytes over plain HTTP.
+
+    The read_file tool returns content inside a JSON-RPC string, which
+    costs two full userspace copies plus JSON escaping per request. This
+    route hands the validated path to Starlette's FileResponse, which
+    streams it in chunks (and lets servers with a zero-copy send
+    extension push bytes kernel-side), so large binary files skip the
+    tool-layer copies entirely.
+
+    Args:
+        request: Incoming request; path parameter is relative to the allowed root
+
+    Returns:
+        The file contents, or a plain-text error response
+
+    """
+    try:
+        validated_path = utils.validate_path(request.path_params["file_path"])
+    except ValueError as e:
+        return PlainTextResponse(str(e), status_code=403)
+
+    if not validated_path.is_file():
+        return PlainTextResponse("File not found", status_code=404)
+
+    return FileResponse(validated_path, media_type="application/octet-stream")
+
+
+def create_app() -> Any:
+    """Build the ASGI app for a uvicorn worker process.
+
+    Workers are separate processes, so each one re-reads the allowed root
+    from the environment and initializes its own io_uring instance.
+    Sessions cannot be pinned to a worker without sticky routing, so the
+    multi-worker app runs the Streamable HTTP transport stateless.
+
+    Returns:
+        ASGI application serving the MCP endpoints
+
+    """
+    utils.set_allowed_root(Path(os.environ[ALLOWED_ROOT_ENV]))
+    io_backend.init_ring()
+    return mcp.http_app(stateless_http=True)
+
+
 def main() -> None:
     """Run the filesystem MCP server."""
     parser = argparse.ArgumentParser(description="Filesystem MCP Server with Streamable HTTP support")
@@ -33,22 +85,55 @@ def main() -> None:
         default=".",
         help="Root directory for filesystem operations (default: current directory)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of uvicorn worker processes; >1 runs stateless sessions (default: 1)",
+    )
     args = parser.parse_args()
 
-    utils.ALLOWED_ROOT = Path(args.allowed_root).resolve()
+    allowed_root = utils.set_allowed_root(Path(args.allowed_root))
 
-    if not utils.ALLOWED_ROOT.exists():
-        logger.error("Allowed root directory does not exist: %s", utils.ALLOWED_ROOT)
+    if not allowed_root.exists():
+        logger.error("Allowed root directory does not exist: %s", allowed_root)
         exit(1)
 
-    if not utils.ALLOWED_ROOT.is_dir():
-        logger.error("Allowed root is not a directory: %s", utils.ALLOWED_ROOT)
+    if not allowed_root.is_dir():
+        logger.error("Allowed root is not a directory: %s", allowed_root)
         exit(1)
 
+    # uvicorn picks uvloop and httptools up automatically when installed
+    # (the uvicorn[standard] extra); installing the uvloop policy here also
+    # covers any loop created before uvicorn takes over.
+    try:
+        import uvloop
+
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
+    io_backend.init_ring()
+
     logger.info("Starting Filesystem MCP Server")
-    logger.info("Allowed root: %s", utils.ALLOWED_ROOT)
+    logger.info("Allowed root: %s", allowed_root)
     logger.info("Listening on: http://0.0.0.0:%s/mcp", args.port)
 
+    if args.workers > 1:
+        import uvicorn
+
+        logger.info("Running with %s worker processes (stateless sessions)", args.workers)
+        os.environ[ALLOWED_ROOT_ENV] = str(allowed_root)
+        uvicorn.run(
+            "filesystem.server:create_app",
+            factory=True,
+            host="0.0.0.0",
+            port=args.port,
+            workers=args.workers,
+        )
+        return
+
     mcp.run(transport="streamable-http", host="0.0.0.0", port=args.port)
 
 
@@ -1,15 +1,129 @@
 """MCP tool functions for filesystem operations."""
 
+import errno
+import os
 import shutil
-from datetime import datetime
+import stat
+import time
+from functools import lru_cache
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
+import anyio
+
+from . import io_backend
 from .utils import validate_path
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from fastmcp import FastMCP
 
 
+_LIST_HEADER = f"{'Name':<40} {'Type':<6} {'Size':>12}        {'Modified'}"
+_LIST_SEPARATOR = "-" * 80
+
+# Recently observed missing paths mapped to when they were last probed.
+# IDE-style clients speculatively probe the same nonexistent paths over and
+# over; a short TTL lets those re-probes fail without touching the
+# filesystem while staying fresh enough that newly created files appear.
+_missing_paths: dict[str, float] = {}
+_MISSING_TTL = 1.0
+_MISSING_CACHE_SIZE = 1024
+
+
+def _check_known_missing(validated_path: "Path", message: str) -> None:
+    """Raise FileNotFoundError if the path was recently seen to be missing."""
+    key = str(validated_path)
+    marked = _missing_paths.get(key)
+    if marked is not None:
+        if time.monotonic() - marked < _MISSING_TTL:
+            raise FileNotFoundError(message)
+        del _missing_paths[key]
+
+
+def _mark_missing(validated_path: "Path") -> None:
+    if len(_missing_paths) >= _MISSING_CACHE_SIZE:
+        _missing_paths.clear()
+    _missing_paths[str(validated_path)] = time.monotonic()
+
+
+def _forget_missing(validated_path: "Path") -> None:
+    _missing_paths.pop(str(validated_path), None)
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(ts: int) -> str:
+    """Format a whole-second timestamp as an ISO 8601 string.
+
+    Directory listings repeat the same mtimes over and over; caching the
+    formatted string skips a datetime object and strftime call per entry.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts))
+
+
+def _format_entries(validated_path: "Path") -> list[str]:
+    """Scan a directory and format one listing row per entry, sorted by name."""
+    with os.scandir(validated_path) as it:
+        entries_raw = sorted(it, key=attrgetter("name"))
+
+    lines = []
+    for entry in entries_raw:
+        st = entry.stat(follow_symlinks=False)
+        is_regular = stat.S_ISREG(st.st_mode)
+        entry_type = "dir" if stat.S_ISDIR(st.st_mode) else "file"
+        size = st.st_size if is_regular else 0
+        modified = _format_timestamp(int(st.st_mtime))
+
+        lines.append(f"{entry.name:<40} {entry_type:<6} {size:>12} bytes  {modified}")
+
+    return lines
+
+
+def _raise_walk_error(error: OSError) -> None:
+    raise error
+
+
+def _rmtree(root: "Path") -> None:
+    """Delete a directory tree bottom-up via os.fwalk.
+
+    fwalk drives scandir underneath, so entry types come from the
+    directory read itself, and it yields each directory's open fd:
+    removing entries relative to that fd means a directory swapped for a
+    symlink mid-delete cannot redirect the unlinks outside the tree,
+    preserving shutil.rmtree's fd-based symlink-attack protection. Scan
+    errors are re-raised rather than skipped, so an unreadable subtree
+    surfaces as PermissionError instead of a misleading "not empty"
+    failure.
+    """
+    for _dirpath, dirnames, filenames, dir_fd in os.fwalk(root, topdown=False, onerror=_raise_walk_error):
+        for name in filenames:
+            os.unlink(name, dir_fd=dir_fd)
+        for name in dirnames:
+            try:
+                os.rmdir(name, dir_fd=dir_fd)
+            except NotADirectoryError:
+                # A symlink to a directory is listed in dirnames but must
+                # be unlinked, not followed.
+                os.unlink(name, dir_fd=dir_fd)
+    os.rmdir(root)
+
+
+def _move(source: "Path", destination: "Path") -> None:
+    """Move a path, falling back to copy+delete across filesystems.
+
+    os.replace is a single rename syscall on the same device; rename
+    fails with EXDEV across mount points (e.g. separate bind mounts under
+    the allowed root), where shutil.move copies and removes instead.
+    """
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, destination)
+
+
 def register_tools(mcp: "FastMCP") -> None:
     """Register all filesystem tools with the MCP server.
 
@@ -19,66 +133,72 @@ def register_tools(mcp: "FastMCP") -> None:
     """
 
     @mcp.tool()
-    async def read_file(path: str) -> str:
+    async def read_file(path: str, max_bytes: int | None = None) -> str:
         """Read the contents of a file as text.
 
         Args:
             path: File path relative to allowed root
+            max_bytes: Maximum number of bytes to read; larger files are
+                truncated at the limit (default: read the whole file)
 
         Returns:
             File contents as string
 
         """
         validated_path = validate_path(path)
+        _check_known_missing(validated_path, f"File not found: {path}")
 
         if not validated_path.exists():
+            _mark_missing(validated_path)
             raise FileNotFoundError(f"File not found: {path}")
 
         if not validated_path.is_file():
             raise ValueError(f"Path is not a file: {path}")
 
         try:
-            return validated_path.read_text()
+            return await anyio.to_thread.run_sync(io_backend.read_text, validated_path, max_bytes)
         except UnicodeDecodeError as e:
             raise ValueError(f"Unable to decode file as text: {e}")
         except PermissionError:
             raise PermissionError(f"Permission denied reading file: {path}")
 
     @mcp.tool()
-    async def list_directory(path: str = ".") -> str:
+    async def list_directory(path: str = ".", metadata: bool = True) -> str:
         """List files and subdirectories in a directory.
 
         Args:
             path: Directory path relative to allowed root (default: current directory)
+            metadata: Whether to include type/size/mtime columns; names-only
+                listings skip the per-entry stat and are much faster on very
+                large directories (default: True)
 
         Returns:
             Formatted string with directory contents including metadata
 
         """
         validated_path = validate_path(path)
+        _check_known_missing(validated_path, f"Directory not found: {path}")
 
         if not validated_path.exists():
+            _mark_missing(validated_path)
             raise FileNotFoundError(f"Directory not found: {path}")
 
         if not validated_path.is_dir():
             raise ValueError(f"Path is not a directory: {path}")
 
         try:
-            entries = []
-            for item in sorted(validated_path.iterdir()):
-                stat = item.stat()
-                entry_type = "dir" if item.is_dir() else "file"
-                size = stat.st_size if item.is_file() else 0
-                modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
-
-                entries.append(f"{item.name:<40} {entry_type:<6} {size:>12} bytes  {modified}")
-
-            if not entries:
+            if not metadata:
+                names = await anyio.to_thread.run_sync(io_backend.list_names, validated_path)
+                if not names:
+                    return f"Directory '{path}' is empty"
+                names.sort()
+                return "\n".join(names)
+
+            entry_lines = await anyio.to_thread.run_sync(_format_entries, validated_path)
+            if not entry_lines:
                 return f"Directory '{path}' is empty"
 
-            header = f"{'Name':<40} {'Type':<6} {'Size':>12}        {'Modified'}"
-            separator = "-" * 80
-            return f"{header}\n{separator}\n" + "\n".join(entries)
+            return "\n".join([_LIST_HEADER, _LIST_SEPARATOR, *entry_lines])
         except PermissionError:
             raise PermissionError(f"Permission denied accessing directory: {path}")
 
@@ -103,7 +223,8 @@ def register_tools(mcp: "FastMCP") -> None:
             raise ValueError(f"Parent directory does not exist: {validated_path.parent}")
 
         try:
-            validated_path.write_text(content)
+            await anyio.to_thread.run_sync(io_backend.write_text, validated_path, content)
+            _forget_missing(validated_path)
             return f"Successfully wrote {len(content)} characters to '{path}'"
         except PermissionError:
             raise PermissionError(f"Permission denied writing to file: {path}")
@@ -128,6 +249,7 @@ def register_tools(mcp: "FastMCP") -> None:
 
         try:
             validated_path.mkdir(parents=True, exist_ok=True)
+            _forget_missing(validated_path)
             return f"Successfully created directory: {path}"
         except PermissionError:
             raise PermissionError(f"Permission denied creating directory: {path}")
@@ -152,7 +274,8 @@ def register_tools(mcp: "FastMCP") -> None:
             raise ValueError(f"Path is not a file (use delete_directory for directories): {path}")
 
         try:
-            validated_path.unlink()
+            await anyio.to_thread.run_sync(validated_path.unlink)
+            _mark_missing(validated_path)
             return f"Successfully deleted file: {path}"
         except PermissionError:
             raise PermissionError(f"Permission denied deleting file: {path}")
@@ -179,9 +302,11 @@ def register_tools(mcp: "FastMCP") -> None:
 
         try:
             if recursive:
-                shutil.rmtree(validated_path)
+                await anyio.to_thread.run_sync(_rmtree, validated_path)
+                _mark_missing(validated_path)
                 return f"Successfully deleted directory and contents: {path}"
             validated_path.rmdir()
+            _mark_missing(validated_path)
             return f"Successfully deleted empty directory: {path}"
         except OSError as e:
             if "not empty" in str(e).lower():
@@ -213,7 +338,9 @@ def register_tools(mcp: "FastMCP") -> None:
             raise ValueError(f"Destination parent directory does not exist: {validated_dest.parent}")
 
         try:
-            validated_source.rename(validated_dest)
+            await anyio.to_thread.run_sync(_move, validated_source, validated_dest)
+            _forget_missing(validated_dest)
+            _mark_missing(validated_source)
             item_type = "directory" if validated_dest.is_dir() else "file"
             return f"Successfully moved {item_type} from '{source}' to '{destination}'"
         except PermissionError:
@@ -231,18 +358,23 @@ def register_tools(mcp: "FastMCP") -> None:
 
         """
         validated_path = validate_path(path)
+        _check_known_missing(validated_path, f"Path not found: {path}")
 
-        if not validated_path.exists():
+        try:
+            st = os.stat(validated_path)
+        except (FileNotFoundError, NotADirectoryError):
+            # NotADirectoryError means a path component is a file, e.g.
+            # "notes.txt/x"; surface it as the same sanitized not-found
+            # error rather than leaking the absolute server-side path.
+            _mark_missing(validated_path)
             raise FileNotFoundError(f"Path not found: {path}")
 
         try:
-            stat = validated_path.stat()
-
-            is_dir = validated_path.is_dir()
-            is_file = validated_path.is_file()
-            size = stat.st_size if is_file else 0
-            modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
-            created = datetime.fromtimestamp(stat.st_ctime).isoformat()
+            is_dir = stat.S_ISDIR(st.st_mode)
+            is_file = stat.S_ISREG(st.st_mode)
+            size = st.st_size if is_file else 0
+            modified = _format_timestamp(int(st.st_mtime))
+            created = _format_timestamp(int(st.st_ctime))
 
             info_lines = [
                 f"Path: {path}",
@@ -250,11 +382,11 @@ def register_tools(mcp: "FastMCP") -> None:
                 f"Size: {size:,} bytes" if is_file else "Size: N/A (directory)",
                 f"Modified: {modified}",
                 f"Created: {created}",
-                f"Permissions: {oct(stat.st_mode)[-3:]}",
+                f"Permissions: {oct(st.st_mode)[-3:]}",
             ]
 
             if is_dir:
-                item_count = len(list(validated_path.iterdir()))
+                item_count = await anyio.to_thread.run_sync(io_backend.count_entries, validated_path)
                 info_lines.append(f"Items: {item_count}")
 
             return "\n".join(info_lines)
@@ -1,8 +1,36 @@
 """Utility functions for path validation."""
 
+import os
 from pathlib import Path
 
 ALLOWED_ROOT: Path | None = None
+_ALLOWED_ROOT_STR: str | None = None
+
+# Maps relative path -> (resolved path, mtime_ns of its parent when cached).
+# A changed parent mtime means entries were added/removed/renamed there, so
+# the cached resolution may be stale and is recomputed.
+_VALIDATION_CACHE: dict[str, tuple[Path, int]] = {}
+_VALIDATION_CACHE_SIZE = 1024
+
+
+def set_allowed_root(root: Path) -> Path:
+    """Resolve and store the allowed root directory.
+
+    Called once at startup so validate_path can compare against the
+    resolved root without re-running the realpath() chain on every call.
+
+    Args:
+        root: Root directory for filesystem operations
+
+    Returns:
+        The resolved root
+
+    """
+    global ALLOWED_ROOT, _ALLOWED_ROOT_STR  # noqa: PLW0603
+    ALLOWED_ROOT = root.resolve()
+    _ALLOWED_ROOT_STR = str(ALLOWED_ROOT)
+    _VALIDATION_CACHE.clear()
+    return ALLOWED_ROOT
 
 
 def validate_path(relative_path: str) -> Path:
@@ -18,14 +46,52 @@ def validate_path(relative_path: str) -> Path:
         ValueError: If path is outside allowed root or ALLOWED_ROOT not set
 
     """
-    if ALLOWED_ROOT is None:
+    if ALLOWED_ROOT is None or _ALLOWED_ROOT_STR is None:
         raise ValueError("Server not properly initialized: ALLOWED_ROOT not set")
 
-    full_path = ALLOWED_ROOT / relative_path
-    resolved = full_path.resolve()
-    allowed = ALLOWED_ROOT.resolve()
+    # Fast path for plain names like "notes.txt", the overwhelmingly common
+    # case: the root is already resolved, so the only component that could
+    # redirect the path is the name itself. One islink check replaces the
+    # whole realpath() chain; symlinks fall through to full resolution so
+    # containment still holds. The guard must reject every separator the
+    # platform accepts (on Windows "sub/../x" contains no backslash) plus
+    # drive-relative names like "C:evil", or the check below is skipped
+    # for paths that are not single components at all.
+    if (
+        os.sep not in relative_path
+        and (os.altsep is None or os.altsep not in relative_path)
+        and not os.path.splitdrive(relative_path)[0]
+        and relative_path not in {"", ".", ".."}
+    ):
+        candidate = ALLOWED_ROOT / relative_path
+        if not os.path.islink(candidate):
+            return candidate
+
+    cached = _VALIDATION_CACHE.get(relative_path)
+    if cached is not None:
+        resolved, parent_mtime = cached
+        try:
+            if os.stat(resolved.parent).st_mtime_ns == parent_mtime:
+                return resolved
+        except OSError:
+            pass
+        del _VALIDATION_CACHE[relative_path]
 
-    if not str(resolved).startswith(str(allowed)):
+    # One realpath() pass over a plain string join; building an
+    # intermediate Path just to call .resolve() costs a second round of
+    # parsing and normalization.
+    resolved = Path(os.path.realpath(os.path.join(_ALLOWED_ROOT_STR, relative_path)))
+
+    if not resolved.is_relative_to(ALLOWED_ROOT):
         raise ValueError(f"Path '{relative_path}' is outside allowed root directory")
 
+    try:
+        parent_mtime = os.stat(resolved.parent).st_mtime_ns
+    except OSError:
+        return resolved
+
+    if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_SIZE:
+        _VALIDATION_CACHE.pop(next(iter(_VALIDATION_CACHE)))
+    _VALIDATION_CACHE[relative_path] = (resolved, parent_mtime)
+
     return resolved